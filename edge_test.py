@@ -5,8 +5,14 @@
 # Script Usage:
 # 1. Define test cases in the `test_cases` list, where each item contains a pair of [latitude, longitude]
 #    and a description.
-# 2. The script computes geohashes for each coordinate over precision levels from 1 to 12.
+# 2. The script computes geohashes for each coordinate over precision levels from 1 to 12
+#    (the upper bound can be changed with `--max_precision`, e.g. `python edge_test.py --max_precision 8`).
 # 3. For each precision level, the geohash value is displayed along with its precision.
+#
+# When Numba is enabled with `GEOHASH_USE_NUMBA=1`, the numeric kernels in `geohash` are compiled
+# once at import time (and cached on disk), so no warm-up call is needed before the loop.
+
+import argparse
 
 from geohash import Geohash
 
@@ -23,10 +29,49 @@ test_cases = [
     ([90.0, 180.0], 'North Pole with Max Longitude (East)'),
 ]
 
-# Calculate and display Geohash
-for lat_lng, description in test_cases:
-    print(f'{lat_lng}: {description}')
-    for precision in range(1, 13):
-        gh = Geohash.init_with_lat_lng(lat_lng, precision)
-        print(f'  precision {precision}: {gh.get_geohash()}')
-    print()
+
+def print_edge_geohashes(cases, precisions):
+    """
+    Prints the geohash of every test case for each of the given precision levels.
+
+    Parameters:
+        cases (list): Pairs of [latitude, longitude] and a description.
+        precisions (iterable): Geohash lengths to compute.
+    """
+    precisions = list(precisions)
+    max_precision = max(precisions)
+    for lat_lng, description in cases:
+        print(f'{lat_lng}: {description}')
+        # A shorter geohash is a prefix of a longer one, so encoding once at the largest precision suffices
+        geohash = Geohash.init_with_lat_lng(list(lat_lng), max_precision).get_geohash()
+        for precision in precisions:
+            print(f'  precision {precision}: {geohash[:precision]}')
+        print()
+
+
+def positive_int(value):
+    """
+    Parses a command line value as an integer of at least 1.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid int value: {value!r}') from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Display geohashes of edge-case coordinates.')
+    parser.add_argument(
+        '--max_precision',
+        type=positive_int,
+        default=12,
+        help='Largest geohash length to display (default: 12).',
+    )
+    args = parser.parse_args()
+    print_edge_geohashes(test_cases, range(1, args.max_precision + 1))
@@ -1,5 +1,315 @@
+import math
+import os
+from functools import lru_cache
 from typing import List, Union, Tuple
 
+# Numba is optional and opt-in: the kernels below are compiled with it only when GEOHASH_USE_NUMBA
+# is set and Numba is installed, and run as plain Python otherwise. Importing Numba and loading
+# the compiled kernels (which also writes its cache files) adds about half a second to the import
+# of this module, for a per-call saving of only a couple of microseconds.
+njit = None
+if os.environ.get('GEOHASH_USE_NUMBA'):
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+# NumPy is optional and only needed by the batch API; it is imported on the first batch call
+np = None
+
+_BASE_32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_BASE_32_BYTES = _BASE_32.encode('ascii')
+
+# ASCII lookup table mapping a character code to its 5-bit value; 255 marks invalid characters
+_DECODE_LUT = bytes(_BASE_32.index(chr(i)) if chr(i) in _BASE_32 else 255 for i in range(128))
+_INVALID_CODE = 255
+
+# The same mapping as a full 256-entry table for bytes.translate
+_DECODE_TRANS = _DECODE_LUT + bytes([_INVALID_CODE]) * 128
+
+# Translation table deleting every valid character, so only invalid ones survive str.translate
+_INVALID_CHARS_TRANS = str.maketrans('', '', _BASE_32)
+
+# Morton (bit-interleaved) encoding: 30 bits per axis give a 60-bit code, i.e. 12 characters
+_MORTON_AXIS_BITS = 30
+_MORTON_BITS = 2 * _MORTON_AXIS_BITS
+_MORTON_AXIS_MAX = (1 << _MORTON_AXIS_BITS) - 1
+_MAX_MORTON_LENGTH = _MORTON_BITS // 5
+_LAT_SCALE = (1 << _MORTON_AXIS_BITS) / 180.0
+_LNG_SCALE = (1 << _MORTON_AXIS_BITS) / 360.0
+# Cell sizes; every cell edge -90 + i * _LAT_CELL (resp. -180 + i * _LNG_CELL) is an exact float
+_LAT_CELL = 180.0 / (1 << _MORTON_AXIS_BITS)
+_LNG_CELL = 360.0 / (1 << _MORTON_AXIS_BITS)
+
+# Neighbor lists are cached up to this order; order 3 has 48 neighbors, and the count grows quadratically
+_MAX_CACHED_NEIGHBOR_ORDER = 3
+
+
+def _normalize_angle_180(lng: float) -> float:
+    if -180 <= lng <= 180:
+        return lng  # Already normalized; the common case needs no arithmetic
+    is_negative = lng < 0  # Extract sign information
+    lng = lng % 360  # Normalize to [0, 360)
+    if lng > 180:
+        lng -= 360  # Shift angles > 180
+    if is_negative and lng == 180:
+        return -180  # Handle edge case for -180
+    return lng
+
+
+def _normalize_lat(lat: float) -> float:
+    if -90 <= lat <= 90:
+        return lat  # Already normalized; the common case needs no arithmetic
+    lat = _normalize_angle_180(lat)
+    return 180 - lat if lat > 90 else (-180 - lat if lat < -90 else lat)
+
+
+def _jit(signature: str):
+    """
+    Compiles a numeric kernel with Numba for the given signature when Numba is enabled.
+
+    The kernels only use integer and float arithmetic that behaves the same in Python and
+    in Numba's 64-bit types, so without Numba they are returned unchanged.
+    """
+    def decorate(func):
+        return func if njit is None else njit(signature, cache=True)(func)
+    return decorate
+
+
+@_jit('int64(int64)')
+def _spread_bits(v):
+    """
+    Spreads the lower 32 bits of an integer so that a zero bit is inserted above each of them.
+
+    Args:
+        v (int): A non-negative integer below 2**32.
+
+    Returns:
+        int: The spread integer, e.g. 0b1011 becomes 0b1000101.
+    """
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+
+@_jit('int64(float64, float64, float64, float64)')
+def _quantize(value, min_value, cell_size, scale):
+    """
+    Computes the 30-bit index of the cell containing a value, exactly as bisection would.
+
+    Args:
+        value (float): The value to quantize, at least `min_value`.
+        min_value (float): The lower bound of the axis (-90 or -180).
+        cell_size (float): The width of a cell on the axis.
+        scale (float): The number of cells per unit, i.e. 1 / `cell_size`.
+
+    Returns:
+        int: The cell index; the upper bound of the axis belongs to the last cell.
+    """
+    index = min(int((value - min_value) * scale), _MORTON_AXIS_MAX)
+    # The float arithmetic above can round across a cell edge, so check against the exact edges
+    if value < min_value + index * cell_size:
+        index -= 1
+    elif index < _MORTON_AXIS_MAX and value >= min_value + (index + 1) * cell_size:
+        index += 1
+    return index
+
+
+@_jit('int64(float64, float64, int64)')
+def _encode_core(lat, lng, length):
+    """
+    Encodes normalized latitude and longitude into the integer bit code of a geohash.
+
+    Args:
+        lat (float): The latitude in [-90, 90].
+        lng (float): The longitude in [-180, 180].
+        length (int): The geohash length, at most `_MAX_MORTON_LENGTH`.
+
+    Returns:
+        int: The 5 * length bit code, longitude bit first.
+    """
+    # Quantize to 30-bit cell indices; the upper bounds (90 and 180) belong to the last cell
+    lat_bits = _quantize(lat, -90.0, _LAT_CELL, _LAT_SCALE)
+    lng_bits = _quantize(lng, -180.0, _LNG_CELL, _LNG_SCALE)
+
+    # Longitude takes the even positions counted from the most significant bit
+    bit_code = (_spread_bits(lng_bits) << 1) | _spread_bits(lat_bits)
+    return bit_code >> (_MORTON_BITS - 5 * length)
+
+
+@_jit('int64(int64)')
+def _compact_bits(v):
+    """
+    Inverse of `_spread_bits`: collects every other bit of an integer, starting with bit 0.
+
+    Args:
+        v (int): A non-negative integer below 2**64.
+
+    Returns:
+        int: The compacted integer, e.g. 0b1000101 becomes 0b1011.
+    """
+    v &= 0x5555555555555555
+    v = (v | (v >> 1)) & 0x3333333333333333
+    v = (v | (v >> 2)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v >> 4)) & 0x00FF00FF00FF00FF
+    v = (v | (v >> 8)) & 0x0000FFFF0000FFFF
+    v = (v | (v >> 16)) & 0x00000000FFFFFFFF
+    return v
+
+
+@_jit('UniTuple(int64, 2)(int64, int64)')
+def _deinterleave(bit_code, num_bits):
+    """
+    Splits the bit code of a geohash into latitude and longitude cell indices.
+
+    Args:
+        bit_code (int): The geohash bits, longitude bit first; at most `_MORTON_BITS` bits.
+        num_bits (int): The number of bits in `bit_code`.
+
+    Returns:
+        tuple: (latitude cell index, longitude cell index).
+    """
+    if num_bits % 2 == 0:
+        return _compact_bits(bit_code), _compact_bits(bit_code >> 1)
+    return _compact_bits(bit_code >> 1), _compact_bits(bit_code)
+
+
+@_jit('UniTuple(float64, 4)(int64, int64)')
+def _decode_core(bit_code, num_bits):
+    """
+    Decodes the integer bit code of a geohash into its latitude and longitude intervals.
+
+    The code is de-interleaved into latitude and longitude cell indices, which are scaled back
+    to degrees. Cell bounds are dyadic fractions of the full range, so the result is exact.
+
+    Args:
+        bit_code (int): The geohash bits, longitude bit first; at most `_MORTON_BITS` bits.
+        num_bits (int): The number of bits in `bit_code`.
+
+    Returns:
+        tuple: (min_latitude, max_latitude, min_longitude, max_longitude).
+    """
+    lng_num_bits = (num_bits + 1) // 2
+    lat_num_bits = num_bits // 2
+    lat_bits, lng_bits = _deinterleave(bit_code, num_bits)
+
+    lat_width = 180.0 / (1 << lat_num_bits)
+    lng_width = 360.0 / (1 << lng_num_bits)
+    lat_lo = -90.0 + lat_bits * lat_width
+    lng_lo = -180.0 + lng_bits * lng_width
+    return lat_lo, lat_lo + lat_width, lng_lo, lng_lo + lng_width
+
+
+def _decode_bisect(values: bytes) -> Tuple[float, float, float, float]:
+    """
+    Decodes a geohash of any length by bisecting the latitude and longitude intervals.
+
+    The bits are streamed character by character, so no integer of the full geohash is built.
+
+    Args:
+        values (bytes): The 5-bit value of each geohash character, as from `Geohash._geohash_to_values`.
+
+    Returns:
+        tuple: (min_latitude, max_latitude, min_longitude, max_longitude).
+    """
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    is_even = True
+    for value in values:
+        for shift in (4, 3, 2, 1, 0):  # Iterate from MSB to LSB of the character
+            bit = (value >> shift) & 1
+            if is_even:
+                mid = (lng_lo + lng_hi) / 2
+                if bit == 1:
+                    lng_lo = mid
+                else:
+                    lng_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if bit == 1:
+                    lat_lo = mid
+                else:
+                    lat_hi = mid
+            is_even = not is_even
+    return lat_lo, lat_hi, lng_lo, lng_hi
+
+
+# The Python kernels also accept NumPy arrays, which the batch API relies on
+_spread_bits_py = getattr(_spread_bits, 'py_func', _spread_bits)
+_compact_bits_py = getattr(_compact_bits, 'py_func', _compact_bits)
+
+if njit is None:
+    # Without Numba, spreading 16 bits at a time through a lookup table is about three times
+    # faster than the mask chain; the 65536-entry table costs roughly 2.5 MB of Python ints
+    _SPREAD_8 = [_spread_bits_py(i) for i in range(1 << 8)]
+    _SPREAD_16 = tuple((_SPREAD_8[i >> 8] << 16) | _SPREAD_8[i & 0xFF] for i in range(1 << 16))
+
+    def _spread_bits(v):
+        return (_SPREAD_16[v >> 16] << 32) | _SPREAD_16[v & 0xFFFF]
+
+def _load_numpy():
+    """
+    Imports NumPy and builds the tables of the batch API on the first call.
+
+    Returns:
+        module: The `numpy` module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    global np, _SPREAD_16_ARRAY, _BASE_32_ARRAY, _DECODE_ARRAY
+    if np is None:
+        import numpy
+        import numpy.char  # NumPy loads numpy.char lazily; load it here rather than inside decode_batch
+        # The same table for the batch API (512 KB of uint64)
+        _SPREAD_16_ARRAY = _spread_bits_py(numpy.arange(1 << 16, dtype=numpy.uint64))
+        # uint8 views of the base32 alphabet and the byte-to-value decode table
+        _BASE_32_ARRAY = numpy.frombuffer(_BASE_32_BYTES, dtype=numpy.uint8)
+        _DECODE_ARRAY = numpy.frombuffer(_DECODE_TRANS, dtype=numpy.uint8)
+        np = numpy  # Set last, so that a failure above is retried on the next call
+    return np
+
+
+def _normalize_angle_180_array(values):
+    # Vectorized counterpart of _normalize_angle_180, including its in-range shortcut
+    values_mod = values % 360
+    values_mod = np.where((values_mod > 180) | ((values < 0) & (values_mod == 180)), values_mod - 360, values_mod)
+    return np.where((-180 <= values) & (values <= 180), values, values_mod)
+
+
+def _quantize_array(values, min_value, cell_size, scale):
+    # Vectorized counterpart of _quantize
+    index = np.minimum(((values - min_value) * scale).astype(np.int64), _MORTON_AXIS_MAX)
+    index -= values < min_value + index * cell_size
+    index += (index < _MORTON_AXIS_MAX) & (values >= min_value + (index + 1) * cell_size)
+    return index.astype(np.uint64)
+
+
+def _make_bits_to_geohash(length: int):
+    """
+    Generates a function converting a 5 * length bit code into a geohash string.
+
+    The generated function is straight-line code with every shift folded into a literal,
+    so converting a bit code runs no Python-level loop.
+
+    Args:
+        length (int): The number of characters the generated function produces.
+
+    Returns:
+        function: A function taking the integer bit code and returning the geohash string.
+    """
+    chars = ' + '.join(f'_BASE_32[(bit_code >> {5 * i}) & 0b11111]' for i in reversed(range(length)))
+    namespace = {'_BASE_32': _BASE_32}
+    exec(f'def bits_to_geohash_{length}(bit_code):\n    return {chars}\n', namespace)
+    return namespace[f'bits_to_geohash_{length}']
+
+
+# Specialized bit code to geohash converters for every length of the Morton code path
+_BITS_TO_GEOHASH = {length: _make_bits_to_geohash(length) for length in range(1, _MAX_MORTON_LENGTH + 1)}
+
 
 class Geohash:
     """
@@ -11,6 +321,7 @@ class Geohash:
 
     Attributes:
         _geohash: The internal representation of the geohash string.
+        _interval_cache: The decoded intervals of `_geohash`, or None until `_interval` first needs them.
 
     Methods:
         - init_with_lat_lng: Initializes a geohash from latitude and longitude.
@@ -19,9 +330,9 @@ class Geohash:
         - decode: Decodes a geohash back to latitude and longitude.
     """
 
-    _BASE_32 = '0123456789bcdefghjkmnpqrstuvwxyz'
-    _BASE_32_RESULT = list(_BASE_32)
-    _BASE_32_TABLE = {c: i for i, c in enumerate(_BASE_32)}
+    __slots__ = ('_geohash', '_interval_cache')
+
+    _BASE_32 = _BASE_32
 
     def __init__(self, lat_lng: List[Union[float, int]] = None, length: int = 11, geohash: str = None):
         """
@@ -41,12 +352,9 @@ class Geohash:
             raise ValueError('"lat_lng" and "geohash" cannot be specified at the same time.')
         if lat_lng is None and geohash is None:
             geohash = 's0000000000'
+        self._interval_cache = None  # Set by _interval
         if lat_lng is not None:
-            Geohash._validate_lat_lng(lat_lng)
-            self._validate_length(length)
-            lat_lng[0] = self._normalize_lat(lat_lng[0])
-            lat_lng[1] = self._normalize_angle_180(lat_lng[1])
-            self._geohash = self._encode(lat_lng[0], lat_lng[1], length)
+            self._geohash = self._encode_lat_lng(lat_lng, length)
         else:
             self._validate_geohash(geohash)
             self._geohash = geohash
@@ -87,15 +395,18 @@ class Geohash:
 
         Raises:
             TypeError: If lat_lng is not a list or its items are not float or int.
-            ValueError: If the length of lat_lng is not 2.
+            ValueError: If the length of lat_lng is not 2, or if an item is NaN or infinite.
         """
         if not isinstance(lat_lng, list):
             raise TypeError('"lat_lng" must be a list.')
         if len(lat_lng) != 2:
             raise ValueError('"lat_lng" must have 2 and only 2 items.')
-        for item in lat_lng:
-            if not isinstance(item, (float, int)):
-                raise TypeError('Items of "lat_lng" must be float or integer.')
+        lat, lng = lat_lng
+        if not isinstance(lat, (float, int)) or not isinstance(lng, (float, int)):
+            raise TypeError('Items of "lat_lng" must be float or integer.')
+        # Only floats can be NaN or infinite; math.isfinite would overflow on very large ints
+        if (isinstance(lat, float) and not math.isfinite(lat)) or (isinstance(lng, float) and not math.isfinite(lng)):
+            raise ValueError('Items of "lat_lng" must be finite.')
 
     @classmethod
     def _validate_geohash(cls, s: str):
@@ -113,9 +424,8 @@ class Geohash:
             raise TypeError('"geohash" must be a string.')
         if not s:
             raise ValueError('"geohash" must have at least one character.')
-        for c in s:
-            if c not in cls._BASE_32:
-                raise ValueError('Invalid characters.')
+        if s.translate(_INVALID_CHARS_TRANS):  # Anything left after deleting valid characters
+            raise ValueError('Invalid characters.')
 
     @classmethod
     def init_with_lat_lng(cls, lat_lng: List[Union[float, int]], length: int = 11):
@@ -137,6 +447,7 @@ class Geohash:
         Raises:
             TypeError: If `lat_lng` is not a list, or if any of its items are not float or int.
             ValueError: If `lat_lng` does not contain exactly two items.
+            ValueError: If the latitude or longitude is NaN or infinite.
             TypeError: If `length` is not an integer.
             ValueError: If `length` is less than 1.
 
@@ -186,12 +497,47 @@ class Geohash:
         """
         return cls(geohash=geohash)
 
+    @classmethod
+    def init_with_int(cls, geohash_int: int, length: int = 11):
+        """
+        Initializes a Geohash object from an integer geohash as returned by `encode_int`.
+
+        The integer holds the full 60-bit (12-character) code; the leading `length` characters
+        are kept, exactly as if the original coordinates had been encoded with that length.
+
+        Args:
+            geohash_int (int): The integer geohash, between 0 and 2**60 - 1.
+            length (int, optional): The length of the geohash string (default is 11, at most 12).
+
+        Raises:
+            TypeError: If `geohash_int` or `length` is not an integer.
+            ValueError: If `geohash_int` is out of range, or if `length` is less than 1
+                or greater than 12.
+
+        Returns:
+            Geohash: A Geohash instance initialized from the given integer geohash.
+
+        Examples:
+            >>> gh = Geohash.init_with_int(Geohash.encode_int(42.583008, -5.625000), 12)
+            >>> print(gh.get_geohash())
+            ezs420000001
+        """
+        if not isinstance(geohash_int, int):
+            raise TypeError('"geohash_int" must be an integer.')
+        if not 0 <= geohash_int < 1 << _MORTON_BITS:
+            raise ValueError(f'"geohash_int" must be between 0 and 2**{_MORTON_BITS} - 1.')
+        cls._validate_length(length)
+        if length > _MAX_MORTON_LENGTH:
+            raise ValueError(f'"length" must be at most {_MAX_MORTON_LENGTH} for an integer geohash.')
+        return cls(geohash=_BITS_TO_GEOHASH[length](geohash_int >> (_MORTON_BITS - 5 * length)))
+
     def get_geohash(self) -> str:
         return self._geohash
 
     def set_geohash(self, s: str):
         self._validate_geohash(s)
         self._geohash = s
+        self._interval_cache = None
 
     def encode_with_lat_lng(self, lat_lng: List[Union[float, int]], length: int = 11) -> None:
         """
@@ -209,6 +555,7 @@ class Geohash:
         Raises:
             TypeError: If `lat_lng` is not a list, or any of its items are not of type `float` or `int`.
             ValueError: If `lat_lng` does not contain exactly two elements.
+            ValueError: If the latitude or longitude is NaN or infinite.
 
         Example:
             >>> gh = Geohash()  # Create a new instance of the Geohash class initialized with geohash 's0000000000'
@@ -231,16 +578,260 @@ class Geohash:
             >>> gh.encode_with_lat_lng([37.7749])  # Missing longitude
             ValueError: "lat_lng" must have 2 and only 2 items.
         """
-        self._validate_lat_lng(lat_lng)
-        self._validate_length(length)
-        lat_lng[0] = self._normalize_lat(lat_lng[0])
-        lat_lng[1] = self._normalize_angle_180(lat_lng[1])
-        self._geohash = self._encode(lat_lng[0], lat_lng[1], length)
+        self._geohash = self._encode_lat_lng(lat_lng, length)
+        self._interval_cache = None
+
+    @classmethod
+    def _encode_lat_lng(cls, lat_lng: List[Union[float, int]], length: int) -> str:
+        """
+        Validates, normalizes and encodes a latitude and longitude pair.
+
+        This is the shared core of `__init__` and `encode_with_lat_lng`. As in both of them,
+        the normalized values are written back into `lat_lng`.
+
+        Args:
+            lat_lng (List[Union[float, int]]): A list containing the latitude and longitude.
+            length (int): The desired length of the generated geohash.
+
+        Returns:
+            str: The encoded geohash string.
+        """
+        cls._validate_lat_lng(lat_lng)
+        cls._validate_length(length)
+        lat_lng[0] = lat = _normalize_lat(lat_lng[0])
+        lat_lng[1] = lng = _normalize_angle_180(lat_lng[1])
+        return cls._encode(lat, lng, length)
+
+    @classmethod
+    def encode_batch(cls, lats, lngs, length: int = 11):
+        """
+        Encodes arrays of latitudes and longitudes into geohash strings in one vectorized pass.
+
+        Latitude and longitude values are normalized exactly as in `encode_with_lat_lng`, then
+        quantized and bit-interleaved over the whole array with NumPy instead of point by point.
+
+        Args:
+            lats (array_like): Latitudes to encode.
+            lngs (array_like): Longitudes to encode. Must have the same shape as `lats`.
+            length (int, optional): The desired length of the generated geohashes (default is 11).
+
+        Returns:
+            numpy.ndarray: An array of geohash strings with the same shape as `lats`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If `lats` and `lngs` have different shapes.
+            ValueError: If a latitude or longitude is NaN or infinite.
+            TypeError: If `length` is not an integer.
+            ValueError: If `length` is less than 1.
+
+        Example:
+            >>> Geohash.encode_batch([37.7749, 51.5074], [-122.4194, -0.1278], length=7)
+            array(['9q8yyk8', 'gcpvj0d'], dtype='<U7')
+        """
+        try:
+            _load_numpy()
+        except ImportError:
+            raise ImportError('"encode_batch" requires NumPy.') from None
+        cls._validate_length(length)
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        if lats.shape != lngs.shape:
+            raise ValueError('"lats" and "lngs" must have the same shape.')
+        if not (np.isfinite(lats).all() and np.isfinite(lngs).all()):
+            raise ValueError('"lats" and "lngs" must be finite.')
+
+        # Vectorized counterparts of _normalize_angle_180 and _normalize_lat
+        lngs = _normalize_angle_180_array(lngs)
+        lats = np.where((-90 <= lats) & (lats <= 90), lats, _normalize_angle_180_array(lats))
+        lats = np.where(lats > 90, 180 - lats, np.where(lats < -90, -180 - lats, lats))
+
+        if length > _MAX_MORTON_LENGTH:
+            return np.array(
+                [cls._encode_bisect(lat, lng, length) for lat, lng in zip(lats.ravel(), lngs.ravel())],
+                dtype=f'U{length}',
+            ).reshape(lats.shape)
+
+        lat_bits = _quantize_array(lats.ravel(), -90.0, _LAT_CELL, _LAT_SCALE)
+        lng_bits = _quantize_array(lngs.ravel(), -180.0, _LNG_CELL, _LNG_SCALE)
+        lat_bits = (_SPREAD_16_ARRAY[lat_bits >> 16] << 32) | _SPREAD_16_ARRAY[lat_bits & 0xFFFF]
+        lng_bits = (_SPREAD_16_ARRAY[lng_bits >> 16] << 32) | _SPREAD_16_ARRAY[lng_bits & 0xFFFF]
+        bit_codes = (lng_bits << 1) | lat_bits
+
+        # Read out 5 bits per character, most significant first, into a byte buffer
+        chars = np.empty((bit_codes.size, length), dtype=np.uint8)
+        for i in range(length):
+            chars[:, i] = _BASE_32_ARRAY[(bit_codes >> (_MORTON_BITS - 5 * (i + 1))) & 0b11111]
+
+        return chars.view(f'S{length}').ravel().astype(f'U{length}').reshape(lats.shape)
+
+    @classmethod
+    def decode_batch(cls, geohashes):
+        """
+        Decodes an array of geohash strings into their central latitudes and longitudes at once.
+
+        The geohash characters are converted to a bit code per string and de-interleaved with
+        NumPy over the whole array; the results equal those of `decode` for each geohash.
+
+        Args:
+            geohashes (array_like): Geohash strings to decode. They may have different lengths.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The decoded latitudes and longitudes, each with
+            the same shape as `geohashes`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            TypeError: If `geohashes` contains anything other than strings.
+            ValueError: If a geohash is empty or contains invalid characters.
+
+        Example:
+            >>> lats, lngs = Geohash.decode_batch(['ezs42', 'ezs42e'])
+            >>> print(lats, lngs)
+            [42.60498047 42.60223389] [-5.60302734 -5.59753418]
+        """
+        try:
+            _load_numpy()
+        except ImportError:
+            raise ImportError('"decode_batch" requires NumPy.') from None
+        if not isinstance(geohashes, np.ndarray) or geohashes.dtype.kind == 'O':
+            # Check each item, since NumPy would silently turn e.g. [123] or ['ezs42', 1] into strings
+            geohashes = np.asarray(geohashes, dtype=object)
+            if not all(isinstance(geohash, str) for geohash in geohashes.flat):
+                raise TypeError('"geohashes" must contain only strings.')
+            geohashes = geohashes.astype(str)
+        elif geohashes.dtype.kind == 'S':
+            try:
+                geohashes = geohashes.astype(str)
+            except UnicodeDecodeError:
+                raise ValueError('Invalid characters.') from None
+        elif geohashes.dtype.kind != 'U':
+            raise TypeError('"geohashes" must contain only strings.')
+        flat = geohashes.ravel()
+        if flat.size == 0:
+            return np.zeros(geohashes.shape), np.zeros(geohashes.shape)
+
+        lengths = np.char.str_len(flat)
+        if lengths.min() < 1:
+            raise ValueError('"geohash" must have at least one character.')
+        if lengths.max() > _MAX_MORTON_LENGTH:
+            decoded = np.array([cls(geohash=geohash).decode() for geohash in flat.tolist()])
+            return decoded[:, 0].reshape(geohashes.shape), decoded[:, 1].reshape(geohashes.shape)
+
+        try:
+            encoded = flat.astype('S')
+        except UnicodeEncodeError:
+            raise ValueError('Invalid characters.') from None
+        width = encoded.dtype.itemsize
+        values = _DECODE_ARRAY[encoded.view(np.uint8).reshape(flat.size, width)]
+        in_geohash = np.arange(width) < lengths[:, None]  # Shorter geohashes are padded with null bytes
+        if np.any(values[in_geohash] == _INVALID_CODE):
+            raise ValueError('Invalid characters.')
+
+        bit_codes = np.zeros(flat.size, dtype=np.uint64)
+        for i in range(width):
+            bit_codes = np.where(in_geohash[:, i], (bit_codes << 5) | values[:, i], bit_codes)
+
+        # Vectorized counterpart of _decode_core
+        num_bits = 5 * lengths
+        is_even = num_bits % 2 == 0
+        lat_bits = _compact_bits_py(np.where(is_even, bit_codes, bit_codes >> 1))
+        lng_bits = _compact_bits_py(np.where(is_even, bit_codes >> 1, bit_codes))
+        lat_width = np.ldexp(180.0, -(num_bits // 2))
+        lng_width = np.ldexp(360.0, -((num_bits + 1) // 2))
+        lat_lo = -90.0 + lat_bits * lat_width
+        lng_lo = -180.0 + lng_bits * lng_width
+        lats = (lat_lo + (lat_lo + lat_width)) / 2
+        lngs = (lng_lo + (lng_lo + lng_width)) / 2
+
+        return lats.reshape(geohashes.shape), lngs.reshape(geohashes.shape)
+
+    @staticmethod
+    def encode_int(lat: Union[float, int], lng: Union[float, int]) -> int:
+        """
+        Encodes a latitude and longitude pair into an integer geohash.
+
+        The integer is the full-precision 60-bit code (the bits of a 12-character geohash,
+        longitude bit first), which sorts and range-queries like the geohash string itself.
+        The base32 conversion is skipped entirely; use `init_with_int` to get the string form.
+
+        Args:
+            lat (Union[float, int]): The latitude. It is normalized like in `encode_with_lat_lng`.
+            lng (Union[float, int]): The longitude. It is normalized like in `encode_with_lat_lng`.
+
+        Returns:
+            int: The integer geohash, between 0 and 2**60 - 1.
+
+        Raises:
+            TypeError: If `lat` or `lng` is not a float or an int.
+            ValueError: If `lat` or `lng` is NaN or infinite.
+
+        Example:
+            >>> Geohash.encode_int(0.0, 0.0)
+            864691128455135232
+        """
+        Geohash._validate_lat_lng([lat, lng])
+        return _encode_core(_normalize_lat(lat), _normalize_angle_180(lng), _MAX_MORTON_LENGTH)
+
+    @staticmethod
+    def encode_raw(lat: Union[float, int], lng: Union[float, int], length: int = 11) -> str:
+        """
+        Encodes a latitude and longitude pair into a geohash string without validating the input.
+
+        This is the fast path for callers that encode many coordinates they already trust:
+        the values are normalized like in `encode_with_lat_lng`, but their types and the length
+        are not checked, and no Geohash instance is created. Only NaN and infinite values are
+        rejected, since no backend can place them in a cell.
+
+        Args:
+            lat (Union[float, int]): The latitude. Must be a float or an int.
+            lng (Union[float, int]): The longitude. Must be a float or an int.
+            length (int, optional): The desired geohash length, a positive integer (default is 11).
+
+        Returns:
+            str: The encoded geohash string.
+
+        Raises:
+            ValueError: If `lat` or `lng` is NaN or infinite.
+
+        Example:
+            >>> Geohash.encode_raw(37.7749, -122.4194, 9)
+            '9q8yyk8yt'
+        """
+        if (isinstance(lat, float) and not math.isfinite(lat)) or (isinstance(lng, float) and not math.isfinite(lng)):
+            raise ValueError('"lat" and "lng" must be finite.')
+        return Geohash._encode(_normalize_lat(lat), _normalize_angle_180(lng), length)
 
-    def _encode(self, lat: float = 0, lng: float = 0, length: int = 11) -> str:
+    @staticmethod
+    def _encode(lat: float = 0, lng: float = 0, length: int = 11) -> str:
         """
         Encodes latitude and longitude into a geohash string.
 
+        Up to `_MAX_MORTON_LENGTH` characters, latitude and longitude are quantized to integers
+        and bit-interleaved into a single Morton code by `_encode_core`, which is then read out
+        5 bits at a time by a converter specialized for the length.
+        Longer geohashes fall back to the interval bisection in `_encode_bisect`.
+
+        Args:
+            lat (float): The latitude to encode.
+            lng (float): The longitude to encode.
+            length (int): The desired geohash length.
+
+        Returns:
+            str: The encoded geohash string.
+        """
+        if length > _MAX_MORTON_LENGTH:
+            return Geohash._encode_bisect(lat, lng, length)
+
+        return _BITS_TO_GEOHASH[length](_encode_core(lat, lng, length))
+
+    @staticmethod
+    def _encode_bisect(lat: float, lng: float, length: int) -> str:
+        """
+        Encodes latitude and longitude into a geohash string by bisecting their intervals.
+
+        This arbitrary-precision path is used for geohashes longer than the Morton code supports.
+
         Args:
             lat (float): The latitude to encode.
             lng (float): The longitude to encode.
@@ -251,11 +842,12 @@ class Geohash:
         """
         lng_min, lng_max = -180.0, 180.0
         lat_min, lat_max = -90.0, 90.0
+        chars = bytearray()  # Output buffer, one ASCII byte per character
         bit_code = 0
-        total_bits = length * 5
+        bits_left = 5  # Bits still to be accumulated before the next character
         is_lng = True
 
-        for _ in range(total_bits):
+        for _ in range(5 * length):
             if is_lng:  # Longitude case
                 mid = (lng_min + lng_max) / 2
                 if lng < mid:
@@ -273,12 +865,13 @@ class Geohash:
                     bit_code = (bit_code << 1) | 1
                     lat_min = mid
             is_lng = not is_lng
+            bits_left -= 1
+            if not bits_left:  # Emit the character of every 5 bits right away
+                chars.append(_BASE_32_BYTES[bit_code])
+                bit_code = 0
+                bits_left = 5
 
-        # Convert the integer bit sequence into a geohash string
-        return ''.join(
-            self._int_to_base_32((bit_code >> (5 * i)) & 0b11111)
-            for i in reversed(range(length))
-        )
+        return chars.decode('ascii')
 
     def decode_to_interval(self) -> tuple[list[float], list[float]]:
         """
@@ -307,12 +900,13 @@ class Geohash:
 
         Details:
             This function operates by converting the geohash string into its binary representation.
-            Using this binary data, it iteratively reconstructs the latitude and longitude
-            intervals by alternating each bit between:
+            The bits alternate between:
               - Longitude bits (even positions)
               - Latitude bits (odd positions).
-            For every bit, the method either splits the interval into the upper or lower half
-            based on the bit's value (1 for upper, 0 for lower).
+            For geohashes of up to 12 characters, the bits are de-interleaved into latitude and
+            longitude cell indices, which are scaled back to the interval bounds directly.
+            Longer geohashes are decoded bit by bit: for every bit, the interval is split into
+            the upper or lower half based on the bit's value (1 for upper, 0 for lower).
 
             Precision Limitations:
                 At very high precision (long geohash strings, i.e., above 11 characters),
@@ -321,28 +915,24 @@ class Geohash:
                 inaccuracies might arise. While these are minor, users should account for
                 possible deviations when performing high-precision operations.
         """
-        # Latitude and Longitude ranges
-        lat_range = [-90.0, 90.0]
-        lng_range = [-180.0, 180.0]
-
-        # Precompute the bitstream
-        bitstream = Geohash._geohash_to_bits(self._geohash)
-        num_bits = len(self._geohash) * 5  # Total number of bits (5 bits per character)
-
-        # Traverse the bits and update ranges
-        is_even = True
-        for bit_position in range(num_bits - 1, -1, -1):  # Iterate from MSB to LSB
-            bit = (bitstream >> bit_position) & 1  # Extract the current bit
-            range_ref = lng_range if is_even else lat_range
-            mid = (range_ref[0] + range_ref[1]) / 2
-            if bit == 1:
-                range_ref[0] = mid  # Update lower bound
-            else:
-                range_ref[1] = mid  # Update upper bound
+        lat_lo, lat_hi, lng_lo, lng_hi = self._interval()
+
+        return [lat_lo, lat_hi], [lng_lo, lng_hi]
 
-            is_even = not is_even  # Alternate between lat/lng
+    def _interval(self) -> Tuple[float, float, float, float]:
+        """
+        Returns the decoded intervals of the current geohash as a flat tuple, decoding it only once.
 
-        return lat_range, lng_range
+        Returns:
+            Tuple[float, float, float, float]: (min_latitude, max_latitude, min_longitude, max_longitude).
+        """
+        if self._interval_cache is None:  # Decoded once per geohash value
+            num_bits = len(self._geohash) * 5  # Total number of bits (5 bits per character)
+            if num_bits <= _MORTON_BITS:
+                self._interval_cache = _decode_core(Geohash._geohash_to_bits(self._geohash), num_bits)
+            else:  # Too long for a 64-bit Morton code
+                self._interval_cache = _decode_bisect(Geohash._geohash_to_values(self._geohash))
+        return self._interval_cache
 
     def decode(self) -> Tuple[float, float]:
         """
@@ -378,9 +968,9 @@ class Geohash:
             - Python's floating-point accuracy may cause minor rounding errors in
               high-precision operations. These errors are negligible for most use cases.
         """
-        interval_lat, interval_lng = self.decode_to_interval()
+        lat_lo, lat_hi, lng_lo, lng_hi = self._interval()  # No interval lists needed for the midpoint
 
-        return (interval_lat[0] + interval_lat[1]) / 2, (interval_lng[0] + interval_lng[1]) / 2
+        return (lat_lo + lat_hi) / 2, (lng_lo + lng_hi) / 2
 
     def neighbors(self, order: int = 1) -> List[str]:
         """
@@ -414,30 +1004,148 @@ class Geohash:
 
             - i and j range from -order to +order.
             - The origin (0, 0) is excluded to ensure only the true neighbors are selected.
+
+            Each offset is applied to the latitude and longitude cell indices of the geohash,
+            which are interleaved back into a geohash, so no coordinate is re-encoded.
+            Results for orders up to 3 are cached per geohash string and order, so repeated calls
+            are lookups.
         """
         if not isinstance(order, int) or order < 1:
             raise TypeError('"order" must be a natural number.')
 
-        # Retrieve latitude and longitude intervals as well as their center and width
-        interval_lat, interval_lng = self.decode_to_interval()
-        delta_lat = interval_lat[1] - interval_lat[0]  # Latitude interval width
-        delta_lng = interval_lng[1] - interval_lng[0]  # Longitude interval width
-        lat = (interval_lat[0] + interval_lat[1]) / 2  # Center latitude
-        lng = (interval_lng[0] + interval_lng[1]) / 2  # Center longitude
-
-        # Pre-compute relative positions for neighbors based on the specified order
-        relative_positions = [
+        if len(self) > _MAX_MORTON_LENGTH:
+            return self._neighbors_by_interval(self._neighbor_offsets(order))
+
+        if order > _MAX_CACHED_NEIGHBOR_ORDER:  # Too many neighbors per entry to keep in the cache
+            return list(self._morton_neighbors(self._geohash, order))
+
+        return list(self._cached_morton_neighbors(self._geohash, order))  # Copied so callers can't alter the cache
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _cached_morton_neighbors(geohash: str, order: int) -> Tuple[str, ...]:
+        """
+        Cached `_morton_neighbors` for orders up to `_MAX_CACHED_NEIGHBOR_ORDER`.
+
+        The result only depends on the geohash string and `order`, so it is cached for both.
+        With at most 48 neighbors per entry, the cache holds at most about 50,000 strings.
+        """
+        return Geohash._morton_neighbors(geohash, order)
+
+    @staticmethod
+    def _morton_neighbors(geohash: str, order: int) -> Tuple[str, ...]:
+        """
+        Computes the neighbors of a geohash of up to 12 characters by walking its integer cell indices.
+
+        Args:
+            geohash (str): A valid geohash of at most 12 characters.
+            order (int): The distance from the geohash.
+
+        Returns:
+            Tuple[str, ...]: The neighboring geohashes, in the order of `_neighbor_offsets`.
+        """
+        length = len(geohash)
+        num_bits = length * 5
+        bit_code = Geohash._geohash_to_bits(geohash)
+        lat_bits, lng_bits = _deinterleave(bit_code, num_bits)
+        lat_cells = 1 << (num_bits // 2)
+        lng_mask = (1 << ((num_bits + 1) // 2)) - 1
+        # The most significant bit is a longitude bit, so longitude sits on the odd positions when
+        # the total number of bits is even
+        lat_shift, lng_shift = (0, 1) if num_bits % 2 == 0 else (1, 0)
+
+        # Offsets move one axis at a time, so each spread row and column is computed once
+        # and every neighbor is a single OR instead of a full interleave
+        lat_rows = []
+        for i in range(-order, order + 1):
+            # Latitude reflects over the poles as in _normalize_lat; longitude wraps around
+            lat_tmp = (lat_bits + i) % (2 * lat_cells)
+            if lat_tmp >= lat_cells:
+                lat_tmp = 2 * lat_cells - 1 - lat_tmp
+            lat_rows.append(_spread_bits(lat_tmp) << lat_shift)
+        lng_columns = [_spread_bits((lng_bits + j) & lng_mask) << lng_shift for j in range(-order, order + 1)]
+
+        geohashes = []  # To store all neighboring geohashes
+
+        for i, j in Geohash._neighbor_offsets(order):
+            neighbor_code = lat_rows[i + order] | lng_columns[j + order]
+            # Only the trailing characters that differ from the current geohash are converted
+            num_chars = ((neighbor_code ^ bit_code).bit_length() + 4) // 5
+            if num_chars:
+                geohashes.append(geohash[:length - num_chars] + _BITS_TO_GEOHASH[num_chars](neighbor_code))
+            else:  # Reflected back onto the current cell next to a pole
+                geohashes.append(geohash)
+
+        return tuple(geohashes)
+
+    @staticmethod
+    def _neighbor_offsets(order: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Returns the relative (latitude, longitude) cell offsets of all neighbors within `order`.
+
+        The offsets only depend on `order`, so they are cached for orders up to
+        `_MAX_CACHED_NEIGHBOR_ORDER`; larger orders hold too many offsets per entry to keep.
+
+        Args:
+            order (int): The distance from the current geohash.
+
+        Returns:
+            Tuple[Tuple[int, int], ...]: The offsets, excluding (0, 0).
+        """
+        if order > _MAX_CACHED_NEIGHBOR_ORDER:
+            return Geohash._compute_neighbor_offsets(order)
+        return Geohash._cached_neighbor_offsets(order)
+
+    @staticmethod
+    @lru_cache(maxsize=_MAX_CACHED_NEIGHBOR_ORDER)
+    def _cached_neighbor_offsets(order: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Cached `_compute_neighbor_offsets` for orders up to `_MAX_CACHED_NEIGHBOR_ORDER`.
+        """
+        return Geohash._compute_neighbor_offsets(order)
+
+    @staticmethod
+    def _compute_neighbor_offsets(order: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Computes the relative (latitude, longitude) cell offsets of all neighbors within `order`.
+
+        Args:
+            order (int): The distance from the current geohash.
+
+        Returns:
+            Tuple[Tuple[int, int], ...]: The offsets, excluding (0, 0).
+        """
+        return tuple(
             (i, j) for i in range(-order, order + 1)
             for j in range(-order, order + 1)
             if not (i == 0 and j == 0)  # Exclude the current position
-        ]
+        )
+
+    def _neighbors_by_interval(self, relative_positions: Tuple[Tuple[int, int], ...]) -> List[str]:
+        """
+        Computes neighboring geohashes by re-encoding shifted cell centers.
+
+        This arbitrary-precision path is used for geohashes longer than the Morton code supports.
+
+        Args:
+            relative_positions (Tuple[Tuple[int, int], ...]): (latitude, longitude) offsets in cells.
+
+        Returns:
+            List[str]: A list of neighboring geohashes.
+        """
+        # Retrieve latitude and longitude intervals as well as their center and width
+        lat_lo, lat_hi, lng_lo, lng_hi = self._interval()
+        delta_lat = lat_hi - lat_lo  # Latitude interval width
+        delta_lng = lng_hi - lng_lo  # Longitude interval width
+        lat = (lat_lo + lat_hi) / 2  # Center latitude
+        lng = (lng_lo + lng_hi) / 2  # Center longitude
 
         geohashes = []  # To store all neighboring geohashes
 
         for i, j in relative_positions:
             # Adjust latitude and longitude using the relative position
-            lat_tmp = Geohash._normalize_lat(lat + delta_lat * i)
-            lng_tmp = Geohash._normalize_angle_180(lng + delta_lng * j)
+            lat_tmp = _normalize_lat(lat + delta_lat * i)
+            lng_tmp = _normalize_angle_180(lng + delta_lng * j)
 
             # Encode the adjusted latitude and longitude into a geohash
             geohashes.append(self._encode(lat_tmp, lng_tmp, len(self)))
@@ -445,39 +1153,44 @@ class Geohash:
         return geohashes
 
     """
-    Contains utility methods for normalization, conversion, and rounding.
+    Contains utility methods for normalization and conversion.
     """
-    @staticmethod
-    def _normalize_angle_180(lng: float) -> float:
-        is_negative = lng < 0  # Extract sign information
-        lng = lng % 360  # Normalize to [0, 360)
-        if lng > 180:
-            lng -= 360  # Shift angles > 180
-        if is_negative and lng == 180:
-            return -180  # Handle edge case for -180
-        return lng
-
-    @staticmethod
-    def _normalize_lat(lat: float) -> float:
-        lat = Geohash._normalize_angle_180(lat)
-        return 180 - lat if lat > 90 else (-180 - lat if lat < -90 else lat)
-
-    @staticmethod
-    def _bits_to_int(bits: List[str]) -> int:
-        return int(''.join(bits), 2)
+    _normalize_angle_180 = staticmethod(_normalize_angle_180)
+    _normalize_lat = staticmethod(_normalize_lat)
 
     @staticmethod
     def _int_to_base_32(v: int) -> str:
-        return Geohash._BASE_32_RESULT[v]
+        return _BASE_32[v]
 
     @staticmethod
     def _base_32_to_int(c: str) -> int:
-        return Geohash._BASE_32_TABLE[c]
+        code = ord(c)
+        v = _DECODE_LUT[code] if code < 128 else _INVALID_CODE
+        if v == _INVALID_CODE:
+            raise ValueError('Invalid characters.')
+        return v
 
     @staticmethod
-    def _round(val: float, digit: int = 0) -> float:
-        p = 10 ** digit
-        return (val * p * 2 + 1) // 2 / p
+    def _geohash_to_values(geohash: str) -> bytes:
+        """
+        Converts every character of a geohash string to its 5-bit value in a single `bytes.translate` call.
+
+        Args:
+            geohash (str): The input geohash string.
+
+        Returns:
+            bytes: The 5-bit value of each character.
+
+        Raises:
+            ValueError: If the geohash contains invalid characters.
+        """
+        try:
+            values = geohash.encode('ascii').translate(_DECODE_TRANS)  # Convert every character to its 5-bit value
+        except UnicodeEncodeError:
+            raise ValueError('Invalid characters.') from None
+        if _INVALID_CODE in values:
+            raise ValueError('Invalid characters.')
+        return values
 
     @staticmethod
     def _geohash_to_bits(geohash: str) -> int:
@@ -494,7 +1207,6 @@ class Geohash:
             int: An integer where the binary representation encodes the geohash bits.
         """
         bitstream = 0  # Initialize bitstream as an integer
-        for c in geohash:
-            value = Geohash._base_32_to_int(c)  # Convert to 5-bit value
+        for value in Geohash._geohash_to_values(geohash):
             bitstream = (bitstream << 5) | value  # Left-shift and append the 5-bit value
         return bitstream
@@ -35,6 +35,38 @@ import matplotlib.pyplot as plt
 # Import required modules
 from geohash import *
 
+
+def iter_prefix_intervals(geohash_str):
+    """
+    Yields the decoded intervals of every prefix of a geohash, from 1 character up to the full string.
+
+    The prefix intervals are nested, so the bits are processed once in a single pass instead of
+    decoding each prefix from scratch.
+
+    Parameters:
+        geohash_str (str): The geohash string to decode.
+
+    Yields:
+        tuple: The latitude interval, the longitude interval and the bitstream of the prefix.
+    """
+    lat = [-90.0, 90.0]
+    lng = [-180.0, 180.0]
+    bitstream = 0
+    is_even = True
+    for c in geohash_str:
+        value = Geohash._base_32_to_int(c)
+        bitstream = (bitstream << 5) | value
+        for shift in range(4, -1, -1):  # Iterate from MSB to LSB of the character
+            range_ref = lng if is_even else lat
+            mid = (range_ref[0] + range_ref[1]) / 2
+            if (value >> shift) & 1:
+                range_ref[0] = mid
+            else:
+                range_ref[1] = mid
+            is_even = not is_even
+        yield list(lat), list(lng), bitstream
+
+
 # Define the Geohash string to test precision
 geohash = 'ezs42e44yxpy'
 
@@ -43,17 +75,8 @@ lat_ranges = []
 lng_ranges = []
 labels = []
 
-# Loop through each substring of the Geohash (from 1 character up to the full string)
-for i in range(len(geohash)):
-    # Generate a substring of the Geohash up to the current length
-    test_geohash = geohash[0:i + 1]
-
-    # Initialize the Geohash object
-    gh = Geohash.init_with_geohash(geohash=test_geohash)
-
-    # Decode intervals (latitude and longitude ranges)
-    lat, lng = gh.decode_to_interval()
-
+# Loop through each prefix of the Geohash (from 1 character up to the full string)
+for i, (lat, lng, bitstream) in enumerate(iter_prefix_intervals(geohash)):
     # Store ranges for later visualization
     lat_ranges.append(lat[1] - lat[0])  # Latitude interval size
     lng_ranges.append(lng[1] - lng[0])  # Longitude interval size
@@ -62,7 +85,7 @@ for i in range(len(geohash)):
     # Print the results for the current Geohash substring
     print(f'{i + 1:02} char(s) Geohash range: Latitude = {lat}, Longitude = {lng}')
     print(f'{i + 1:02} char(s) shrinking rate: Latitude range = {lat[1] - lat[0]}, Longitude range = {lng[1] - lng[0]}')
-    print(f'{i + 1:02} char(s) Geohash bitstream: {Geohash._geohash_to_bits(test_geohash):b}')
+    print(f'{i + 1:02} char(s) Geohash bitstream: {bitstream:b}')
 
 # Plot results with matplotlib
 plt.figure(figsize=(10, 6))
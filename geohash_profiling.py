@@ -18,10 +18,18 @@ Arguments:
                    (default: "9q8yyzjfwqr").
 - `--output`: File path to save the profiling results. If not provided, results will
               be displayed in the terminal (default: None).
+- `--timing_only`: Run the operations without `cProfile` and report only the elapsed time
+                   measured with `time.perf_counter_ns`, free of the profiler's per-call overhead.
+- `--micro_timings`: Time each operation in isolation without `cProfile`, reporting the best of
+                     7 runs after a warm-up run. Cannot be combined with `--timing_only`.
 
 What the script does:
 1. Initializes the Geohash class with given latitude/longitude or geohash strings.
 2. Tests various Geohash class methods such as encode, decode, and neighbor calculation.
+   Neighbor lists are cached per geohash and order, so the `neighbors` operation is one
+   computation followed by cache lookups; `neighbors_uncached` clears the cache before every call.
+   When NumPy is installed, the batch APIs (`encode_batch`, `decode_batch`) are also profiled
+   over arrays of `repeat_count` points, so each runs as a single vectorized call.
 3. Profiles the performance of these operations with `cProfile` and generates a
    detailed analysis of the most time-consuming methods.
 
@@ -36,11 +44,18 @@ This script is especially useful for:
 """
 import argparse
 import cProfile
-import io
 import pstats
+import sys
+import time
+import timeit
 
 from geohash import Geohash
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed by the batch API
+    np = None
+
 
 class GeohashProfiling:
     def __init__(self, repeat_count, lat_lng, geohash_str, output=None):
@@ -58,32 +73,84 @@ class GeohashProfiling:
         self.geohash_str = geohash_str
         self.output = output
         self.large_lat_lng = [3600.7749, -4320.4194]  # Large lat/lng values for normalization tests
+        # (repeat_count, 2) float64 array for the batch legs, built once outside the profiled run
+        self.lat_lng_array = None if np is None else np.full((repeat_count, 2), lat_lng, dtype=np.float64)
+        self.geohash_array = None if np is None else np.full(repeat_count, geohash_str)
+        if np is not None:
+            # Warm up the batch API, which imports NumPy and builds its tables on the first call
+            Geohash.decode_batch(Geohash.encode_batch(self.lat_lng_array[:1, 0], self.lat_lng_array[:1, 1]))
+
+    def _operations(self):
+        """
+        Returns the profiled legs as (name, callable) pairs in execution order.
+        """
+        geohash = Geohash.init_with_geohash(self.geohash_str)
 
-    def test_operations(self):
         # 1. Initialization using latitude and longitude
-        for _ in range(self.repeat_count // 10):  # Reduce workload
-            _ = Geohash.init_with_lat_lng(self.lat_lng)
+        def init_with_lat_lng():
+            for _ in range(self.repeat_count // 10):  # Reduce workload
+                _ = Geohash.init_with_lat_lng(self.lat_lng)
 
         # 2. Initialization using a geohash string
-        for _ in range(self.repeat_count // 10):
-            _ = Geohash.init_with_geohash(self.geohash_str)
+        def init_with_geohash():
+            for _ in range(self.repeat_count // 10):
+                _ = Geohash.init_with_geohash(self.geohash_str)
 
         # 3. Test encode_with_lat_lng (including large values)
-        geohash = Geohash.init_with_geohash(self.geohash_str)
-        for _ in range(self.repeat_count // 5):
-            geohash.encode_with_lat_lng(self.large_lat_lng)
+        def encode_with_lat_lng():
+            for _ in range(self.repeat_count // 5):
+                geohash.encode_with_lat_lng(self.large_lat_lng)
 
         # 4. Test decode_to_interval
-        for _ in range(self.repeat_count):
-            geohash.decode_to_interval()
+        def decode_to_interval():
+            for _ in range(self.repeat_count):
+                geohash.decode_to_interval()
 
         # 5. Test decode
-        for _ in range(self.repeat_count):
-            geohash.decode()
+        def decode():
+            for _ in range(self.repeat_count):
+                geohash.decode()
+
+        # 6. Test neighbors. Results are cached per geohash and order, so this measures one
+        #    computation followed by cache lookups; the cache is cleared first to keep it that way
+        def neighbors():
+            Geohash._cached_morton_neighbors.cache_clear()
+            for _ in range(self.repeat_count // 10):
+                _ = geohash.neighbors(order=2)
+
+        # 6b. Test neighbors without the cache, clearing it before every call
+        def neighbors_uncached():
+            for _ in range(self.repeat_count // 10):
+                Geohash._cached_morton_neighbors.cache_clear()
+                _ = geohash.neighbors(order=2)
+
+        operations = [
+            ('init_with_lat_lng', init_with_lat_lng),
+            ('init_with_geohash', init_with_geohash),
+            ('encode_with_lat_lng', encode_with_lat_lng),
+            ('decode_to_interval', decode_to_interval),
+            ('decode', decode),
+            ('neighbors', neighbors),
+            ('neighbors_uncached', neighbors_uncached),
+        ]
+        if np is None:
+            return operations
+
+        # 7. Test encode_batch over a whole array of coordinates in one call
+        def encode_batch():
+            _ = Geohash.encode_batch(self.lat_lng_array[:, 0], self.lat_lng_array[:, 1])
 
-        # 6. Test neighbors
-        for _ in range(self.repeat_count // 10):
-            _ = geohash.neighbors(order=2)
+        # 8. Test decode_batch over an array of geohashes
+        def decode_batch():
+            _ = Geohash.decode_batch(self.geohash_array)
+
+        operations.append(('encode_batch', encode_batch))
+        operations.append(('decode_batch', decode_batch))
+        return operations
+
+    def test_operations(self):
+        for _, operation in self._operations():
+            operation()
 
     def profile_operations(self):
         # Start profiling
@@ -92,17 +159,60 @@ class GeohashProfiling:
         self.test_operations()
         profiler.disable()
 
-        # Format and display profiling results
-        result = io.StringIO()
-        stats = pstats.Stats(profiler, stream=result)
-        stats.strip_dirs()
-        stats.sort_stats('cumulative')
-        stats.print_stats(20)
+        # Format and display profiling results, writing straight to the destination stream
         if self.output:
             with open(self.output, 'w') as file:
-                file.write(result.getvalue())
+                self._print_stats(profiler, file)
         else:
-            print(result.getvalue())
+            self._print_stats(profiler, sys.stdout)
+
+    def time_operations(self):
+        """
+        Runs all operations without cProfile and returns the elapsed time in seconds.
+        """
+        start = time.perf_counter_ns()
+        self.test_operations()
+        elapsed = (time.perf_counter_ns() - start) * 1e-9
+
+        result = f'Total time: {elapsed:.6f} s\n'
+        if self.output:
+            with open(self.output, 'w') as file:
+                file.write(result)
+        else:
+            sys.stdout.write(result)
+        return elapsed
+
+    def micro_timings(self, repeat=7, warmup=1):
+        """
+        Times each operation in isolation and returns the best of `repeat` runs per operation.
+
+        Parameters:
+            repeat (int): Number of timed runs per operation; the minimum is reported.
+            warmup (int): Number of untimed runs per operation before timing starts.
+
+        Returns:
+            dict: Operation name to its fastest run time in seconds.
+        """
+        timings = {}
+        for name, operation in self._operations():
+            for _ in range(warmup):
+                operation()
+            timings[name] = min(timeit.repeat(operation, number=1, repeat=repeat))
+
+        result = ''.join(f'{name}: {seconds:.6f} s\n' for name, seconds in timings.items())
+        if self.output:
+            with open(self.output, 'w') as file:
+                file.write(result)
+        else:
+            sys.stdout.write(result)
+        return timings
+
+    @staticmethod
+    def _print_stats(profiler, stream):
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.strip_dirs()
+        stats.sort_stats('cumulative')
+        stats.print_stats(20)
 
 
 if __name__ == "__main__":
@@ -134,6 +244,17 @@ if __name__ == "__main__":
         default=None,
         help='Optional file to save profiling results (default: stdout).',
     )
+    timing_mode = parser.add_mutually_exclusive_group()
+    timing_mode.add_argument(
+        '--timing_only',
+        action='store_true',
+        help='Only measure the total elapsed time, without cProfile.',
+    )
+    timing_mode.add_argument(
+        '--micro_timings',
+        action='store_true',
+        help='Time each operation in isolation (best of 7 runs), without cProfile.',
+    )
     args = parser.parse_args()
     profiler = GeohashProfiling(
         repeat_count=args.repeat_count,
@@ -141,4 +262,9 @@ if __name__ == "__main__":
         geohash_str=args.geohash_str,
         output=args.output,
     )
-    profiler.profile_operations()
+    if args.micro_timings:
+        profiler.micro_timings()
+    elif args.timing_only:
+        profiler.time_operations()
+    else:
+        profiler.profile_operations()
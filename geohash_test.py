@@ -1,7 +1,14 @@
+import math
+import os
+import tempfile
 import unittest
 
 from geohash import Geohash
-from geohash_profiling import GeohashProfiling
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed by the batch API
+    np = None
 
 
 class TestGeohash(unittest.TestCase):
@@ -40,6 +47,16 @@ class TestGeohash(unittest.TestCase):
         geohash.encode_with_lat_lng(lat_lng)
         self.assertEqual(len(geohash.get_geohash()), 11)
 
+    def test_encode_raw(self):
+        """Test that encoding without validation matches initializing from latitude and longitude."""
+        for lat_lng in ([37.7749, -122.4194], [90.0, 180.0], [370, -450]):
+            for length in (1, 11, 13):
+                with self.subTest(lat_lng=lat_lng, length=length):
+                    self.assertEqual(
+                        Geohash.encode_raw(lat_lng[0], lat_lng[1], length),
+                        Geohash.init_with_lat_lng(list(lat_lng), length).get_geohash()
+                    )
+
     def test_decode_to_interval(self):
         """Test decoding geohash into lat/lng intervals."""
         geohash = Geohash.init_with_geohash('9q8yyzjfwqr')
@@ -56,6 +73,15 @@ class TestGeohash(unittest.TestCase):
         self.assertTrue(-90 <= lat_lng[0] <= 90)  # Latitude valid range
         self.assertTrue(-180 <= lat_lng[1] <= 180)  # Longitude valid range
 
+    def test_decode_after_update(self):
+        """Test that decoding reflects geohash updates made after a previous decode."""
+        geohash = Geohash.init_with_geohash('9q8yyzjfwqr')
+        geohash.decode()
+        geohash.set_geohash('ezs42')
+        self.assertEqual(geohash.decode(), Geohash.init_with_geohash('ezs42').decode())
+        geohash.encode_with_lat_lng([0.0, 0.0], 5)
+        self.assertEqual(geohash.decode_to_interval(), Geohash.init_with_geohash('s0000').decode_to_interval())
+
     def test_neighbors(self):
         """Test retrieving neighbors of the geohash."""
         geohash = Geohash.init_with_geohash('9q8yyzjfwqr')
@@ -65,18 +91,154 @@ class TestGeohash(unittest.TestCase):
             self.assertIsInstance(n, str)
             self.assertEqual(len(n), len(geohash.get_geohash()))  # Length matches the original geohash
 
+    def test_neighbors_cached_result_is_copied(self):
+        """Test that modifying returned neighbors does not affect later calls."""
+        geohash = Geohash.init_with_geohash('9q8yyzjfwqr')
+        neighbors = geohash.neighbors(order=1)
+        expected = list(neighbors)
+        neighbors.clear()
+        self.assertEqual(geohash.neighbors(order=1), expected)
+        self.assertEqual(Geohash.init_with_geohash('9q8yyzjfwqr').neighbors(order=1), expected)
+
+    def test_shorter_geohash_is_prefix(self):
+        """Test that encoding with a shorter length yields a prefix of the longer geohash."""
+        lat_lng_list = [
+            [37.7749, -122.4194], [-90.0, -180.0], [90.0, 180.0], [0.0, 180.0], [370, -450],
+            # One ulp below cell edges, where the 12- and 13-character encoders must still agree
+            [44.99999999999999, 0.0], [0.0, 89.99999999999999], [-45.00000000000001, -33.75],
+            [22.499999999999996, 179.99999999999997],
+        ]
+        for lat_lng in lat_lng_list:
+            longest = Geohash.init_with_lat_lng(list(lat_lng), 16).get_geohash()
+            for length in range(1, 16):
+                with self.subTest(lat_lng=lat_lng, length=length):
+                    self.assertEqual(Geohash.init_with_lat_lng(list(lat_lng), length).get_geohash(), longest[:length])
+
+    def test_neighbors_high_order_not_cached(self):
+        """Test that neighbors beyond the cached orders are computed without filling the cache."""
+        geohash = Geohash.init_with_geohash('9q8yyzj')
+        Geohash._cached_morton_neighbors.cache_clear()
+        neighbors = geohash.neighbors(order=4)
+        self.assertEqual(len(neighbors), 80)
+        self.assertEqual(Geohash._cached_morton_neighbors.cache_info().currsize, 0)
+        self.assertEqual(set(geohash.neighbors(order=3)) - set(neighbors), set())  # Order 3 lies within order 4
+
+    def test_neighbor_offsets_high_order_not_cached(self):
+        """Test that neighbor offsets beyond the cached orders are built without filling the cache."""
+        Geohash._cached_neighbor_offsets.cache_clear()
+        for geohash in ('9q8yyzj', 'ezs42e44yxpyzz'):  # Morton and interval paths
+            with self.subTest(geohash=geohash):
+                self.assertEqual(len(Geohash.init_with_geohash(geohash).neighbors(order=5)), 120)
+                self.assertEqual(Geohash._cached_neighbor_offsets.cache_info().currsize, 0)
+        Geohash.init_with_geohash('9q8yyzj').neighbors(order=2)
+        self.assertEqual(Geohash._cached_neighbor_offsets.cache_info().currsize, 1)
+
+    def test_encode_int(self):
+        """Test that integer geohashes convert back to the geohash strings of the same coordinates."""
+        for lat_lng in ([37.7749, -122.4194], [-90.0, -180.0], [90.0, 180.0], [370, -450]):
+            geohash_int = Geohash.encode_int(*lat_lng)
+            for length in (1, 5, 11, 12):
+                with self.subTest(lat_lng=lat_lng, length=length):
+                    self.assertEqual(
+                        Geohash.init_with_int(geohash_int, length).get_geohash(),
+                        Geohash.init_with_lat_lng(list(lat_lng), length).get_geohash()
+                    )
+
+    @staticmethod
+    def _boundary_lat_lng_list():
+        """Returns points exactly on and one ulp around cell edges of a 12-character geohash."""
+        lat_edges = [45.0, 22.5, 0.0, -45.0, -90.0 + 123456789 * 180.0 / 2 ** 30, -90.0 + 987654321 * 180.0 / 2 ** 30]
+        lng_edges = [90.0, 0.0, -33.75, -180.0 + 123456789 * 360.0 / 2 ** 30, -180.0 + 987654321 * 360.0 / 2 ** 30]
+        lat_lng_list = [[89.99999999999999, 0.0], [0.0, 179.99999999999997]]
+        for edge in lat_edges:
+            for lat in (math.nextafter(edge, -math.inf), edge, math.nextafter(edge, math.inf)):
+                lat_lng_list.append([lat, 10.0])
+        for edge in lng_edges:
+            for lng in (math.nextafter(edge, -math.inf), edge, math.nextafter(edge, math.inf)):
+                lat_lng_list.append([10.0, lng])
+        return lat_lng_list
+
+    def test_encode_cell_boundaries(self):
+        """Test that points next to cell edges are encoded into the same cell as by bisection."""
+        for lat_lng in self._boundary_lat_lng_list():
+            with self.subTest(lat_lng=lat_lng):
+                expected = Geohash._encode_bisect(lat_lng[0], lat_lng[1], 12)
+                self.assertEqual(Geohash.init_with_lat_lng(list(lat_lng), 12).get_geohash(), expected)
+                self.assertEqual(Geohash.init_with_int(Geohash.encode_int(*lat_lng), 12).get_geohash(), expected)
+                lat_range, lng_range = Geohash.init_with_geohash(expected).decode_to_interval()
+                self.assertTrue(lat_range[0] <= lat_lng[0] <= lat_range[1])
+                self.assertTrue(lng_range[0] <= lat_lng[1] <= lng_range[1])
+
+    def test_init_with_int_validation(self):
+        """Test that out-of-range integer geohashes and lengths raise a ValueError."""
+        with self.assertRaises(ValueError):
+            Geohash.init_with_int(-1)
+        with self.assertRaises(ValueError):
+            Geohash.init_with_int(1 << 60)
+        with self.assertRaises(ValueError):
+            Geohash.init_with_int(0, 13)
+        with self.assertRaises(TypeError):
+            Geohash.init_with_int('0')
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_encode_batch(self):
+        """Test that batch encoding matches encoding each point on its own."""
+        lat_lng_list = [
+            [37.7749, -122.4194], [-90.0, -180.0], [90.0, 180.0], [0.0, 180.0], [370, -450], [-95, 190],
+            [-1e-14, -1e-14], [-45.00000000000001, -33.75], [-135.5, -179.99999999999997],
+        ]
+        for length in (1, 5, 11, 12, 13):
+            with self.subTest(length=length):
+                geohashes = Geohash.encode_batch(
+                    [lat for lat, _ in lat_lng_list], [lng for _, lng in lat_lng_list], length
+                )
+                expected = [Geohash.init_with_lat_lng(list(lat_lng), length).get_geohash() for lat_lng in lat_lng_list]
+                self.assertEqual(geohashes.tolist(), expected)
+                self.assertEqual(geohashes.dtype, np.dtype(f'U{length}'))
+                self.assertEqual(Geohash.encode_batch([], [], length).dtype, np.dtype(f'U{length}'))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_encode_batch_cell_boundaries(self):
+        """Test that batch encoding places points next to cell edges into the same cell as bisection."""
+        lat_lng_list = self._boundary_lat_lng_list()
+        geohashes = Geohash.encode_batch([lat for lat, _ in lat_lng_list], [lng for _, lng in lat_lng_list], 12)
+        expected = [Geohash._encode_bisect(lat, lng, 12) for lat, lng in lat_lng_list]
+        self.assertEqual(geohashes.tolist(), expected)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_decode_batch(self):
+        """Test that batch decoding matches decoding each geohash on its own."""
+        for geohashes in (['9q8yyzjfwqr', 'ezs42', 's', 'zzzzzzzzzzzz', '00000000'], ['ezs42e44yxpyzz', 'u']):
+            with self.subTest(geohashes=geohashes):
+                lats, lngs = Geohash.decode_batch(geohashes)
+                expected = [Geohash.init_with_geohash(geohash).decode() for geohash in geohashes]
+                self.assertEqual(list(zip(lats.tolist(), lngs.tolist())), expected)
+        with self.assertRaises(ValueError):
+            Geohash.decode_batch(['ezs42', 'invalid'])
+        for geohashes in ([123], ['ezs42', 1], [None], np.array([1, 2])):
+            with self.subTest(geohashes=geohashes):
+                with self.assertRaises(TypeError):
+                    Geohash.decode_batch(geohashes)
+
     # ------------ Profiling Functionality Tests ------------ #
     def test_profiling(self):
         """Test profiling of Geohash operations."""
-        profiler = GeohashProfiling(
-            repeat_count=100,
-            lat_lng=[37.7749, -122.4194],
-            geohash_str='9q8yyzjfwqr'
-        )
-        try:
-            profiler.profile_operations()
-        except Exception as e:
-            self.fail(f'GeohashProfiling.profile_operations() raised an exception: {e}')
+        from geohash_profiling import GeohashProfiling  # Imported here to keep cProfile out of test collection
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'profile_results.txt')
+            profiler = GeohashProfiling(
+                repeat_count=10,
+                lat_lng=[37.7749, -122.4194],
+                geohash_str='9q8yyzjfwqr',
+                output=output,
+            )
+            try:
+                profiler.profile_operations()
+            except Exception as e:
+                self.fail(f'GeohashProfiling.profile_operations() raised an exception: {e}')
+            with open(output) as file:
+                self.assertIn('function calls', file.read())
 
     # ------------ Latitude and Longitude Normalization Tests ------------ #
     def test_lat_lng_normalization(self):
@@ -101,6 +263,17 @@ class TestGeohash(unittest.TestCase):
                 )
 
     # ------------ Invalid Type/Value Test ------------ #
+    def test_in_range_negative_lat_lng(self):
+        """Test that small negative in-range values are encoded as is, without a modulo round trip."""
+        for lat_lng in ([-1e-14, -1e-14], [-45.00000000000001, -33.75], [-89.99999999999999, -179.99999999999997]):
+            with self.subTest(lat_lng=lat_lng):
+                normalized = list(lat_lng)
+                geohash = Geohash.init_with_lat_lng(normalized, 12)
+                self.assertEqual(normalized, lat_lng)  # In-range values are left untouched
+                lat_range, lng_range = geohash.decode_to_interval()
+                self.assertTrue(lat_range[0] <= lat_lng[0] <= lat_range[1])
+                self.assertTrue(lng_range[0] <= lat_lng[1] <= lng_range[1])
+
     def test_empty_lat_lng(self):
         """Test that an empty lat_lng list raises a ValueError."""
         with self.assertRaises(ValueError) as context:
@@ -113,6 +286,32 @@ class TestGeohash(unittest.TestCase):
             Geohash.init_with_lat_lng(['not_a_number', -120])
         self.assertEqual(str(context.exception), 'Items of "lat_lng" must be float or integer.')
 
+    def test_non_finite_lat_lng(self):
+        """Test that NaN and infinite coordinates raise a ValueError on every encoding path."""
+        for lat_lng in ([math.nan, 0.0], [0.0, math.nan], [math.inf, 0.0], [0.0, -math.inf]):
+            with self.subTest(lat_lng=lat_lng):
+                for length in (5, 12, 13):
+                    with self.assertRaises(ValueError):
+                        Geohash.init_with_lat_lng(list(lat_lng), length)
+                    with self.assertRaises(ValueError):
+                        Geohash.encode_raw(*lat_lng, length)
+                with self.assertRaises(ValueError):
+                    Geohash().encode_with_lat_lng(list(lat_lng))
+                with self.assertRaises(ValueError):
+                    Geohash.encode_int(*lat_lng)
+                if np is not None:
+                    with self.assertRaises(ValueError):
+                        Geohash.encode_batch([lat_lng[0]], [lat_lng[1]])
+
+    def test_large_int_lat_lng(self):
+        """Test that integers too large for a float are still normalized and encoded."""
+        for length in (11, 13):
+            with self.subTest(length=length):
+                expected = Geohash.init_with_lat_lng([10 ** 400 % 360 - 360, 5], length).get_geohash()
+                self.assertEqual(Geohash.init_with_lat_lng([10 ** 400, 5], length).get_geohash(), expected)
+                self.assertEqual(Geohash.encode_raw(10 ** 400, 5, length), expected)
+        self.assertEqual(Geohash.init_with_lat_lng([10 ** 400, 5]).get_geohash(), 'h1g8cu2yhrn')
+
     def test_invalid_geohash_characters(self):
         """Test that an invalid geohash string raises a ValueError."""
         with self.assertRaises(ValueError) as context: